@@ -5,64 +5,210 @@ NCERT Textbook Downloader
 Downloads NCERT textbooks using cached catalog from scanner.py.
 Run 'python scanner.py' first to build the catalog.
 """
-import os, sys, json, time, zipfile, shutil
+import os, sys, json, zipfile, shutil, asyncio, argparse, pickle, importlib, signal, functools
 from pathlib import Path
-from typing import Optional, List, Dict
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional, List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
+# Optional: orjson parses the catalog several times faster than stdlib json
 try:
-    import requests
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    os.system(f"{sys.executable} -m pip install requests -q")
-    import requests
+    _loads = json.loads
 
+# Optional: ISA-L inflate is ~2x faster than stock zlib for ZIP extraction
 try:
-    from tqdm import tqdm
+    from isal import isal_zlib
 except ImportError:
-    os.system(f"{sys.executable} -m pip install tqdm -q")
-    from tqdm import tqdm
+    isal_zlib = None
+
+if isal_zlib:
+    _stock_decompressor = zipfile._get_decompressor
+    def _isal_decompressor(compress_type):
+        if compress_type == zipfile.ZIP_DEFLATED:
+            return isal_zlib.decompressobj(-15)
+        return _stock_decompressor(compress_type)
+    zipfile._get_decompressor = _isal_decompressor
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSTANTS
 # ═══════════════════════════════════════════════════════════════════════════════
 BASE_URL = "https://ncert.nic.in/textbook/pdf/"
 CATALOG_FILE = Path(__file__).parent / "catalog.json"
+CATALOG_CACHE = CATALOG_FILE.with_suffix('.pkl')
+CATALOG_MAX_AGE = 180 # days before the menu suggests re-running scanner.py
+CONCURRENCY = 5      # in-flight requests; override with --concurrency
+MAX_RETRIES = 3      # attempts on HTTP 429 before giving up
+RANGE_PARTS = 4      # parallel byte ranges for ZIP downloads
+CHUNK_SIZE = 1 << 18 # async read size; PDFs are MBs, so a coarser progress step is fine
+USER_AGENT = "ncert-downloader/1.0"
 
 LANG_NAMES = {'e':'English', 'h':'Hindi', 'u':'Urdu'}
+DL_OPTIONS_ZIP = ("📦 Complete Book (ZIP)", "📄 Single Chapter", "📥 All Chapters")
+DL_OPTIONS = DL_OPTIONS_ZIP[1:]
 
 # Colors
-C = type('C', (), {
-    'R':'\033[91m','G':'\033[92m','Y':'\033[93m','B':'\033[94m',
-    'M':'\033[95m','C':'\033[96m','W':'\033[97m','D':'\033[90m',
-    'BD':'\033[1m','E':'\033[0m'
-})()
+C = SimpleNamespace(
+    R='\033[91m', G='\033[92m', Y='\033[93m', B='\033[94m',
+    M='\033[95m', C='\033[96m', W='\033[97m', D='\033[90m',
+    BD='\033[1m', E='\033[0m',
+)
+C.HDR = C.BD + C.G    # bold green, precomposed for section headers
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LAZY DEPENDENCIES
+# ═══════════════════════════════════════════════════════════════════════════════
+# requests/tqdm/aiohttp/aiofiles are only imported once a download starts,
+# so browsing the catalog does not pay for them at startup.
+SESSION = None
+RUNNER = None    # one event loop for the whole process, so CLIENT outlives each batch
+CLIENT = None
+
+def _require(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(f"'{name}' is required for downloads. Install it with: pip install {name}") from None
+
+def run_async(coro):
+    """Run coro on the process-wide event loop (uvloop when it is installed).
+    The loop is kept between calls so pooled connections survive it."""
+    global RUNNER
+    if RUNNER is None:
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+        RUNNER = asyncio.Runner(loop_factory=loop_factory)
+    return RUNNER.run(coro)
+
+def close_async():
+    """Close CLIENT and the event loop, if they were ever started."""
+    global RUNNER, CLIENT
+    if RUNNER is None:
+        return
+    if CLIENT is not None:
+        RUNNER.run(CLIENT.close())
+        CLIENT = None
+    RUNNER.close()
+    RUNNER = None
+
+def get_session():
+    """One keep-alive session so repeated GETs reuse the same TCP+TLS connection."""
+    global SESSION
+    if SESSION is None:
+        requests = _require('requests')
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        SESSION = requests.Session()
+        SESSION.headers.update({'Connection': 'keep-alive', 'User-Agent': USER_AGENT})
+        # Every request goes to ncert.nic.in: one pool, sized for parallel callers
+        # Retries (with backoff, honouring Retry-After) happen inside the adapter,
+        # so they reuse the pooled connection instead of starting over
+        retry = Retry(total=3, backoff_factor=1.5, status_forcelist=[429, 502, 503, 504],
+                      allowed_methods=['GET', 'HEAD'])
+        SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry))
+    return SESSION
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CATALOG LOADING
 # ═══════════════════════════════════════════════════════════════════════════════
 def load_catalog() -> Optional[Dict]:
-    """Load catalog from JSON file."""
-    if not CATALOG_FILE.exists():
+    """Load catalog from JSON file, via a pickle cache keyed on its mtime+size."""
+    try:
+        st = CATALOG_FILE.stat()
+    except OSError:
         return None
+    key = (st.st_mtime_ns, st.st_size)
+    
+    try:
+        with open(CATALOG_CACHE, 'rb') as f:
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except Exception:
+        pass
+    
     try:
-        with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        catalog = _loads(CATALOG_FILE.read_bytes())
     except:
         return None
+    
+    try:
+        with open(CATALOG_CACHE, 'wb') as f:
+            pickle.dump(key, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(catalog, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return catalog
+
+class Menus(dict):
+    """Menus as immutable (keys, labels, lengths, max_len), keyed by catalog path: (), (class,),
+    (class, subject), (class, subject, lang). Each is built on first visit
+    and reused, so untouched branches of the catalog cost nothing."""
+    def __init__(self, catalog: Dict):
+        super().__init__()
+        self.classes = catalog["classes"]
+    
+    def __missing__(self, path: tuple) -> Tuple[tuple, tuple, tuple, int]:
+        if len(path) == 0:
+            keys = tuple(sorted(self.classes.keys(), key=int))
+            labels = tuple(f"Class {c}" for c in keys)
+        elif len(path) == 1:
+            keys = labels = tuple(self.classes[path[0]].keys())
+        elif len(path) == 2:
+            keys = tuple(self.classes[path[0]][path[1]]["languages"].keys())
+            labels = tuple(LANG_NAMES[l] for l in keys)
+        else:
+            keys = tuple(self.classes[path[0]][path[1]]["languages"][path[2]]["parts"].keys())
+            labels = tuple(f"Part {p}" for p in keys)
+        lengths = tuple(map(len, labels))
+        menu = self[path] = (keys, labels, lengths, max(lengths) + 6 if labels else 0)
+        return menu
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
-def tw(): 
+@functools.lru_cache(maxsize=1)
+def tw():
+    """Terminal width, cached until the window is resized (SIGWINCH on POSIX)."""
     try: return shutil.get_terminal_size().columns
     except: return 80
 
-def cls(): 
-    os.system('cls' if os.name=='nt' else 'clear')
+if hasattr(signal, 'SIGWINCH'):
+    signal.signal(signal.SIGWINCH, lambda *_: tw.cache_clear())
 
-def banner():
-    w = tw()
-    print(f"{C.C}{C.BD}")
-    print(f"┌{'─'*(w-2)}┐")
+def _enable_vt() -> bool:
+    """Make sure the console understands ANSI escapes (needs opting in on Windows 10+)."""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        k32 = ctypes.windll.kernel32
+        handle = k32.GetStdHandle(-11)             # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not k32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(k32.SetConsoleMode(handle, mode.value | 4))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        return False
+
+_VT = _enable_vt()
+
+def cls():
+    # An escape sequence is one write; os.system forks a shell every screen
+    if _VT:
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+@functools.lru_cache(maxsize=8)
+def _banner_for(w: int) -> str:
+    """Full banner for a terminal width, colour codes included."""
     art = [
         "  ███╗   ██╗ ██████╗███████╗██████╗ ████████╗",
         "  ████╗  ██║██╔════╝██╔════╝██╔══██╗╚══██╔══╝",
@@ -70,52 +216,67 @@ def banner():
         "  ██║╚██╗██║██║     ██╔══╝  ██╔══██╗   ██║   ",
         "  ██║ ╚████║╚██████╗███████╗██║  ██║   ██║   ",
         "  ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═╝  ╚═╝   ╚═╝   ",
+        "📚 NCERT Textbook Downloader 📚",
     ]
+    lines = [f"{C.C}{C.BD}", f"┌{'─'*(w-2)}┐"]
     for line in art:
         pad = (w - 2 - len(line)) // 2
-        print(f"│{' '*pad}{line}{' '*(w-2-pad-len(line))}│")
-    title = "📚 NCERT Textbook Downloader 📚"
-    pad = (w - 2 - len(title)) // 2
-    print(f"│{' '*pad}{title}{' '*(w-2-pad-len(title))}│")
-    print(f"└{'─'*(w-2)}┘{C.E}")
+        lines.append(f"│{' '*pad}{line}{' '*(w-2-pad-len(line))}│")
+    lines.append(f"└{'─'*(w-2)}┘{C.E}\n")
+    return '\n'.join(lines)
+
+def banner():
+    sys.stdout.write(_banner_for(tw()))
 
 def hdr(txt):
-    print(f"\n{C.Y}{'─'*tw()}{C.E}")
-    print(f"{C.BD}{C.G} {txt}{C.E}")
+    sys.stdout.write(f"\n{C.Y}{'─'*tw()}{C.E}\n{C.HDR} {txt}{C.E}\n")
 
-def grid_menu(title, options, cols=4):
-    """Display options in a compact grid."""
+@functools.lru_cache(maxsize=16)
+def _max_opt_len(options: tuple) -> int:
+    return max(len(str(o)) for o in options) + 6
+
+def grid_menu(title, options, cols=4, max_len=None, lengths=None):
+    """Display options in a compact grid. Pass max_len and lengths from
+    Menus to skip measuring the options on every draw."""
     hdr(title)
     if not options:
         print(f"  {C.R}No options available{C.E}")
         return None
     
-    max_len = max(len(str(o)) for o in options) + 6
+    if max_len is None:
+        max_len = _max_opt_len(tuple(options))
     w = tw() - 2
     cols = max(1, min(cols, w // max_len))
     col_w = w // cols
     
+    cyan, end = C.C, C.E
+    out = []
     for i, opt in enumerate(options):
         idx = f"[{i+1:2d}]" if len(options) > 9 else f"[{i+1}]"
-        cell = f" {C.C}{idx}{C.E} {opt}"
-        vis_len = len(idx) + len(str(opt)) + 2
-        padding = col_w - vis_len
-        print(cell + ' '*max(0,padding), end='')
-        if (i+1) % cols == 0: print()
-    if len(options) % cols != 0: print()
-    
-    print(f"\n {C.R}[0]{C.E} Back/Exit")
+        vis_len = len(idx) + (lengths[i] if lengths else len(str(opt))) + 2
+        out.append(f" {cyan}{idx}{end} {opt}{' '*max(0, col_w - vis_len)}")
+        if (i+1) % cols == 0: out.append('\n')
+    if len(options) % cols != 0: out.append('\n')
+    out.append(f"\n {C.R}[0]{C.E} Back/Exit\n")
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
     
+    prompt = f" {C.BD}►{C.E} "
     while True:
         try:
-            ch = input(f" {C.BD}►{C.E} ").strip()
-            if ch == '': continue
-            n = int(ch)
-            if n == 0: return None
-            if 1 <= n <= len(options): return n - 1
-            print(f" {C.R}Invalid{C.E}", end='\r')
+            ch = input(prompt).strip()
+            status = ''
+            if ch != '':
+                n = int(ch)
+                if n == 0: return None
+                if 1 <= n <= len(options): return n - 1
+                status = f"{C.R}Invalid{C.E} "
         except ValueError:
-            print(f" {C.R}Number please{C.E}", end='\r')
+            status = f"{C.R}Number please{C.E} "
+        # Overwrite the rejected prompt line in place rather than stacking
+        # lines under the grid; without ANSI support it goes on the next line
+        if _VT: sys.stdout.write('\x1b[1A\x1b[2K')
+        prompt = f" {status}{C.BD}►{C.E} "
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DOWNLOAD FUNCTIONS
@@ -126,20 +287,38 @@ def make_folder(class_num: int, subject: str, is_chapter=False) -> Path:
     folder.mkdir(parents=True, exist_ok=True)
     return folder
 
+def drop_cache(fd: int, offset: int = 0, length: int = 0):
+    """Tell the kernel a freshly written file won't be reread soon, so its
+    pages can leave the page cache instead of evicting hotter data."""
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+
+def progress(total: int):
+    """Byte progress bar that repaints at most 4x/sec and once per MiB."""
+    tqdm = _require('tqdm').tqdm
+    return tqdm(total=total, unit='B', unit_scale=True, ncols=50,
+                bar_format=' {bar}| {n_fmt}/{total_fmt} [{rate_fmt}]',
+                mininterval=0.25, miniters=1 << 20, smoothing=0)
+
 def download(url: str, path: Path) -> bool:
     try:
-        r = requests.get(url, stream=True, timeout=30)
+        r = get_session().get(url, stream=True, timeout=30)
         r.raise_for_status()
         size = int(r.headers.get('content-length', 0))
         
         print(f"\n {C.C}⬇ {path.name}{C.E} ({size/(1024*1024):.1f} MB)")
         
-        with open(path, 'wb') as f:
-            with tqdm(total=size, unit='B', unit_scale=True, ncols=50, 
-                     bar_format=' {bar}| {n_fmt}/{total_fmt} [{rate_fmt}]') as pb:
-                for chunk in r.iter_content(8192):
-                    f.write(chunk)
-                    pb.update(len(chunk))
+        with open(path, 'wb', buffering=1 << 20) as f:
+            with progress(size) as pb:
+                # One reusable 1 MiB buffer instead of a new bytes object per chunk
+                buf = bytearray(1 << 20)
+                mv = memoryview(buf)
+                r.raw.decode_content = True
+                while (n := r.raw.readinto(buf)):
+                    f.write(mv[:n])
+                    pb.update(n)
+            f.flush()
+            drop_cache(f.fileno())
         
         print(f" {C.G}✓ Done{C.E}")
         return True
@@ -147,16 +326,112 @@ def download(url: str, path: Path) -> bool:
         print(f" {C.R}✗ Failed: {e}{C.E}")
         return False
 
+async def get_client():
+    """One aiohttp session for the whole process: its pooled connections stay
+    alive across downloads, so only the very first request pays the TCP+TLS
+    handshake. Closed by close_async() on exit."""
+    global CLIENT
+    if CLIENT is None:
+        aiohttp = _require('aiohttp')
+        connector = aiohttp.TCPConnector(limit=CONCURRENCY, keepalive_timeout=60, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(sock_connect=30, sock_read=30)
+        CLIENT = aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                       headers={'User-Agent': USER_AGENT})
+    return CLIENT
+
+async def _fetch_range(session, url: str, path: Path, start: int, end: int, pb):
+    """Write bytes [start, end] of url into path at the same offset."""
+    async with session.get(url, headers={'Range': f'bytes={start}-{end}'}) as r:
+        if r.status != 206:
+            raise IOError(f"range {start}-{end} not honoured (HTTP {r.status})")
+        with open(path, 'r+b', buffering=1 << 20) as f:
+            f.seek(start)
+            # aiohttp hands over whatever has arrived, often far less than
+            # CHUNK_SIZE, so batch progress to at most one update per 256 KiB
+            acc = 0
+            async for chunk in r.content.iter_chunked(CHUNK_SIZE):
+                f.write(chunk)
+                acc += len(chunk)
+                if acc >= 1 << 18:
+                    pb.update(acc)
+                    acc = 0
+            pb.update(acc)
+            f.flush()
+            drop_cache(f.fileno(), start, end - start + 1)
+
+async def _probe_size(session, url: str) -> Optional[int]:
+    """One-byte ranged GET: a 206 proves the file exists, that ranges work,
+    and carries the total size in Content-Range - all in a single round trip.
+    Returns None if the server answers without range support."""
+    async with session.get(url, headers={'Range': 'bytes=0-0'}) as r:
+        r.raise_for_status()
+        if r.status != 206:
+            return None
+        total = r.headers.get('Content-Range', '').rpartition('/')[2]
+        return int(total) if total.isdigit() else None
+
+async def _download_ranged(url: str, path: Path) -> Optional[bool]:
+    """Split url into RANGE_PARTS byte ranges fetched concurrently.
+    Returns None when the server does not honour range requests."""
+    session = await get_client()
+    size = await _probe_size(session, url)
+    if size is None or size < RANGE_PARTS:
+        return None
+    
+    print(f"\n {C.C}⬇ {path.name}{C.E} ({size/(1024*1024):.1f} MB, {RANGE_PARTS} streams)")
+    
+    with open(path, 'wb') as f:
+        f.truncate(size)
+    step = -(-size // RANGE_PARTS)
+    with progress(size) as pb:
+        async with asyncio.TaskGroup() as tg:
+            for start in range(0, size, step):
+                end = min(start + step, size) - 1
+                tg.create_task(_fetch_range(session, url, path, start, end, pb))
+    return True
+
+def download_ranged(url: str, path: Path) -> bool:
+    """Parallel range download, falling back to a single stream."""
+    try:
+        ok = run_async(_download_ranged(url, path))
+    except Exception as e:
+        print(f" {C.R}✗ Failed: {e}{C.E}")
+        return False
+    if ok is None:
+        return download(url, path)
+    print(f" {C.G}✓ Done{C.E}")
+    return True
+
+def _extract_entry(z: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path):
+    """Stream one entry to disk through a 1 MiB buffer; memory stays flat."""
+    with z.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+
+def extract_zip(path: Path, dest: Path):
+    """Extract entries across a thread pool; zlib inflate releases the GIL."""
+    root = dest.resolve()
+    with zipfile.ZipFile(path, 'r') as z:
+        # Skip entries that would land outside dest (absolute paths, '..')
+        jobs = [(info, (root / info.filename).resolve()) for info in z.infolist()]
+        jobs = [(info, t) for info, t in jobs if t.is_relative_to(root)]
+        # Create every directory once, up front: explicit dir entries plus
+        # file parents. Workers then only write files and never race on makedirs
+        dirs = {t if info.is_dir() else t.parent for info, t in jobs}
+        for d in sorted(dirs):
+            d.mkdir(parents=True, exist_ok=True)
+        jobs = [(info, t) for info, t in jobs if not info.is_dir()]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(lambda job: _extract_entry(z, *job), jobs))
+
 def download_zip(class_num, subject, book_code):
     url = f"{BASE_URL}{book_code}dd.zip"
     folder = make_folder(class_num, subject)
     path = folder / f"{book_code}dd.zip"
     
-    if download(url, path):
+    if download_ranged(url, path):
         if input(f" Extract? (y/n): ").lower() == 'y':
             try:
-                with zipfile.ZipFile(path, 'r') as z:
-                    z.extractall(folder / book_code)
+                extract_zip(path, folder / book_code)
                 print(f" {C.G}✓ Extracted to {book_code}/{C.E}")
             except: 
                 print(f" {C.R}✗ Extract failed{C.E}")
@@ -179,19 +454,88 @@ def download_chapter(class_num, subject, book_code, chapters):
     folder = make_folder(class_num, subject, True)
     return download(url, folder / f"{book_code}{ch}.pdf")
 
+async def _need_download(session, url: str, path: Path) -> Tuple[bool, Dict[str, str]]:
+    """Compare a local file with the remote size.
+    Returns (skip, headers): skip complete files; for a shorter one, the
+    Range + If-Range headers that resume it only if the remote file is
+    unchanged (a revised edition comes back whole, as a 200)."""
+    try:
+        have = path.stat().st_size
+    except FileNotFoundError:
+        return False, {}
+    async with session.head(url, allow_redirects=True) as r:
+        r.raise_for_status()
+        total = int(r.headers.get('Content-Length', 0))
+        ranged = r.headers.get('Accept-Ranges') == 'bytes'
+        # If-Range needs a strong validator: a weak ETag would never match
+        etag = r.headers.get('ETag', '')
+        validator = etag if etag and not etag.startswith('W/') else r.headers.get('Last-Modified')
+    if not total or have == total:
+        return True, {}
+    if 0 < have < total and ranged and validator:
+        return False, {'Range': f'bytes={have}-', 'If-Range': validator}
+    return False, {}
+
+async def _fetch(session, sem, url: str, path: Path, exists: bool) -> bool:
+    """Stream one file to disk; at most CONCURRENCY run at once, backing off on 429.
+    Existing files are checked: complete ones skipped, truncated ones resumed."""
+    ClientResponseError = _require('aiohttp').ClientResponseError
+    async with sem:
+        try:
+            for attempt in range(MAX_RETRIES):
+                try:
+                    # The HEAD is retried along with the GET: a 429 on either backs off
+                    skip, headers = await _need_download(session, url, path) if exists else (False, {})
+                    if skip:
+                        print(f" {C.Y}⏭ {path.name} exists{C.E}")
+                        return True
+                    async with session.get(url, headers=headers) as r:
+                        r.raise_for_status()
+                        # 206 only answers a Range whose If-Range still matched
+                        mode = 'ab' if r.status == 206 else 'wb'
+                        async with _require('aiofiles').open(path, mode) as f:
+                            # Each aiofiles write is a thread-pool round trip, so
+                            # hand it 1 MiB at a time rather than every 64 KiB chunk
+                            pending = bytearray()
+                            async for chunk in r.content.iter_chunked(CHUNK_SIZE):
+                                pending += chunk
+                                if len(pending) >= 1 << 20:
+                                    await f.write(pending)
+                                    pending.clear()
+                            if pending:
+                                await f.write(pending)
+                            await f.flush()
+                            drop_cache(f.fileno())
+                    break
+                except ClientResponseError as e:
+                    if e.status != 429 or attempt == MAX_RETRIES - 1:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
+            print(f" {C.G}✓ {path.name}{C.E}")
+            return True
+        except Exception as e:
+            print(f" {C.R}✗ {path.name}: {e}{C.E}")
+            return False
+
+async def _download_chapters(jobs) -> int:
+    """Fetch all (url, path, exists) jobs concurrently, return number succeeded."""
+    sem = asyncio.Semaphore(CONCURRENCY)
+    session = await get_client()
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_fetch(session, sem, *job)) for job in jobs]
+    return sum(t.result() for t in tasks)
+
 def download_all_chapters(class_num, subject, book_code, chapters):
     folder = make_folder(class_num, subject, True)
     
     print(f"\n {C.G}Downloading {len(chapters)} files...{C.E}")
-    ok = 0
-    for ch in chapters:
-        path = folder / f"{book_code}{ch}.pdf"
-        if path.exists():
-            print(f" {C.Y}⏭ {path.name} exists{C.E}")
-            ok += 1
-        elif download(f"{BASE_URL}{book_code}{ch}.pdf", path):
-            ok += 1
-        time.sleep(0.2)
+    # Build every (url, path, exists) before any task starts; each file name is
+    # formatted once and shared by its URL and its destination. One directory
+    # read answers "already on disk?" for all chapters instead of a stat each.
+    existing = {e.name for e in os.scandir(folder)}
+    names = [book_code + ch + '.pdf' for ch in chapters]
+    jobs = [(BASE_URL + name, folder / name, name in existing) for name in names]
+    ok = run_async(_download_chapters(jobs))
     
     print(f"\n {C.G}✓ {ok}/{len(chapters)} downloaded{C.E}")
     return ok > 0
@@ -210,6 +554,13 @@ def main():
         return
     
     last_updated = catalog.get("last_updated", "Unknown")[:10]
+    try:
+        age = (datetime.now() - datetime.fromisoformat(last_updated)).days
+    except ValueError:
+        age = 0
+    if age > CATALOG_MAX_AGE:
+        last_updated += f" {C.Y}({age} days old, run 'python scanner.py' to refresh){C.D}"
+    menus = Menus(catalog)
     
     while True:
         cls()
@@ -217,41 +568,38 @@ def main():
         print(f" {C.D}Catalog: {last_updated}{C.E}")
         
         # 1. Select Class
-        available_classes = sorted(catalog["classes"].keys(), key=int)
-        class_options = [f"Class {c}" for c in available_classes]
-        idx = grid_menu("Select Class", class_options)
+        available_classes, class_options, lengths, max_len = menus[()]
+        idx = grid_menu("Select Class", class_options, max_len=max_len, lengths=lengths)
         if idx is None: break
         class_num = available_classes[idx]
         class_data = catalog["classes"][class_num]
         
         # 2. Select Subject
-        subjects = list(class_data.keys())
-        idx = grid_menu(f"Subjects for Class {class_num}", subjects, cols=3)
+        subjects, _, lengths, max_len = menus[(class_num,)]
+        idx = grid_menu(f"Subjects for Class {class_num}", subjects, cols=3, max_len=max_len, lengths=lengths)
         if idx is None: continue
         subject = subjects[idx]
         subj_data = class_data[subject]
         
         # 3. Select Language
-        languages = list(subj_data["languages"].keys())
+        languages, lang_names, lengths, max_len = menus[(class_num, subject)]
         if len(languages) == 1:
             lang = languages[0]
             print(f" {C.D}Only {LANG_NAMES[lang]} available{C.E}")
         else:
-            lang_names = [LANG_NAMES[l] for l in languages]
-            idx = grid_menu("Select Language", lang_names)
+            idx = grid_menu("Select Language", lang_names, max_len=max_len, lengths=lengths)
             if idx is None: continue
             lang = languages[idx]
         
         lang_data = subj_data["languages"][lang]
         
         # 4. Select Part
-        parts = list(lang_data["parts"].keys())
+        parts, part_names, lengths, max_len = menus[(class_num, subject, lang)]
         if len(parts) == 1:
             part = parts[0]
             print(f" {C.D}Only Part {part} available{C.E}")
         else:
-            part_names = [f"Part {p}" for p in parts]
-            idx = grid_menu("Select Part", part_names)
+            idx = grid_menu("Select Part", part_names, max_len=max_len, lengths=lengths)
             if idx is None: continue
             part = parts[idx]
         
@@ -262,15 +610,11 @@ def main():
         
         # Show summary
         print(f"\n{C.Y}{'─'*tw()}{C.E}")
-        print(f" {C.BD}{C.G}Class {class_num} │ {LANG_NAMES[lang]} │ {subject} │ Part {part}{C.E}")
+        print(f" {C.HDR}Class {class_num} │ {LANG_NAMES[lang]} │ {subject} │ Part {part}{C.E}")
         print(f" {C.D}Code: {book_code} │ Chapters: {len(chapters)}{C.E}")
         
         # 5. Download Type
-        dl_opts = []
-        if has_zip:
-            dl_opts.append("📦 Complete Book (ZIP)")
-        dl_opts.extend(["📄 Single Chapter", "📥 All Chapters"])
-        
+        dl_opts = DL_OPTIONS_ZIP if has_zip else DL_OPTIONS
         idx = grid_menu("Download Type", dl_opts, cols=1)
         if idx is None: continue
         
@@ -296,7 +640,17 @@ def main():
     print(f"\n {C.G}👋 Goodbye!{C.E}\n")
 
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="NCERT Textbook Downloader")
+    ap.add_argument('--concurrency', type=int, default=CONCURRENCY,
+                    help=f"parallel chapter downloads (default {CONCURRENCY})")
+    args = ap.parse_args()
+    CONCURRENCY = max(1, args.concurrency)
     try:
         main()
     except KeyboardInterrupt:
         print(f"\n {C.Y}Interrupted{C.E}\n")
+    except ImportError as e:
+        print(f"\n {C.R}✗ {e}{C.E}\n")
+        sys.exit(1)
+    finally:
+        close_async()
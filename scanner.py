@@ -5,27 +5,52 @@ NCERT Catalog Scanner
 Scans ncert.nic.in and caches all available books to catalog.json.
 Run this periodically (e.g., every 6 months) to update the catalog.
 
-Usage: python scanner.py
+Usage: python scanner.py [--refresh] [--quiet]
 """
-import os, sys, json, time, shutil
+import re, sys, json, time, shutil, asyncio, signal, functools, argparse
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
-    import requests
+    import aiohttp
 except ImportError:
-    os.system(f"{sys.executable} -m pip install requests -q")
-    import requests
+    sys.exit("scanner.py needs 'aiohttp'. Install it with: pip install aiohttp")
+
+# Optional: orjson serialises the catalog several times faster than stdlib json
+try:
+    import orjson
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSTANTS
 # ═══════════════════════════════════════════════════════════════════════════════
 BASE_URL = "https://ncert.nic.in/textbook/pdf/"
 CATALOG_FILE = Path(__file__).parent / "catalog.json"
+TEXTBOOK_PAGE = "https://ncert.nic.in/textbook.php"
+USER_AGENT = "ncert-scanner/1.0"
+DISCOVERY_CACHE = Path.home() / ".cache" / "ncert-downloader" / "discovery.json"
+DISCOVERY_TTL = 30 * 86400   # seconds a cached probe result stays valid
+PROBE_TIMEOUT = 3             # seconds to connect, and between reads, per probe
+INDEX_TIMEOUT = 30            # seconds for the whole textbook index page
+VERBOSE = True                # one line per book found; --quiet prints a count per class
 
 CLASS_CODES = {1:'a',2:'b',3:'c',4:'d',5:'e',6:'f',7:'g',8:'h',9:'i',10:'j',11:'k',12:'l'}
 LANG_CODES = {'e':'English', 'h':'Hindi', 'u':'Urdu'}
+SPECIAL_SECTIONS = ('ps','an','ap','gl','lp','dd')
+CHAPTER_MARKERS = (5, 10, 20, 40)    # probes that bound a book's length; 40 = ceiling
+MAX_GAP = 4                          # consecutive missing chapters that end a book
+CHAPTER_NUMS = tuple(f"{n:02d}" for n in range(CHAPTER_MARKERS[-1]))   # '00'..'39'
+
+# Book codes as they appear on the index page: PDF/ZIP links or "lemh1=0-6" entries
+BOOK_CODE_RE = re.compile(r'\b([a-l][ehu][a-z]{2}[1-4])(?:dd\.zip|\d{2}\.pdf|=\d)')
+
+# Book code prefix per (class, language), e.g. (12, 'e') -> 'le'
+BOOKCODE_PREFIX = {(c, l): cc + l for c, cc in CLASS_CODES.items() for l in LANG_CODES}
 
 # All known subject codes
 SUBJECT_CODES = {
@@ -45,57 +70,177 @@ SUBJECT_CODES = {
 }
 
 # Colors
-C = type('C', (), {
-    'R':'\033[91m','G':'\033[92m','Y':'\033[93m','B':'\033[94m',
-    'M':'\033[95m','C':'\033[96m','W':'\033[97m','D':'\033[90m',
-    'BD':'\033[1m','E':'\033[0m'
-})()
+C = SimpleNamespace(
+    R='\033[91m', G='\033[92m', Y='\033[93m', B='\033[94m',
+    M='\033[95m', C='\033[96m', W='\033[97m', D='\033[90m',
+    BD='\033[1m', E='\033[0m',
+)
+C.HDR = C.BD + C.G    # bold green, precomposed for section headers
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
-def tw(): 
+@functools.lru_cache(maxsize=1)
+def tw():
+    """Terminal width, cached until the window is resized (SIGWINCH on POSIX)."""
     try: return shutil.get_terminal_size().columns
     except: return 80
 
-def url_exists(url):
+if hasattr(signal, 'SIGWINCH'):
+    signal.signal(signal.SIGWINCH, lambda *_: tw.cache_clear())
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DISCOVERY CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+# Part and chapter probe results, keyed by book code, persisted between runs
+CACHE = {}
+CACHE_WRITABLE = True   # cleared after the first failed save; the scan goes on without it
+
+def load_cache():
     try:
-        r = requests.head(url, timeout=5, allow_redirects=True)
-        return r.status_code == 200
-    except: 
+        CACHE.update(json.loads(DISCOVERY_CACHE.read_text(encoding='utf-8')))
+    except (OSError, ValueError):
+        pass
+
+def save_cache():
+    global CACHE_WRITABLE
+    if not CACHE_WRITABLE:
+        return
+    try:
+        DISCOVERY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = DISCOVERY_CACHE.with_suffix('.tmp')
+        tmp.write_text(json.dumps(CACHE), encoding='utf-8')
+        tmp.replace(DISCOVERY_CACHE)
+    except OSError as e:
+        CACHE_WRITABLE = False
+        print(f" {C.Y}⚠ Probe cache not saved ({e}); continuing without it{C.E}")
+
+def cache_get(key):
+    hit = CACHE.get(key)
+    if hit and time.time() - hit['ts'] < DISCOVERY_TTL:
+        return hit['value']
+    return None
+
+def cache_put(key, value):
+    CACHE[key] = {'ts': time.time(), 'value': value}
+    return value
+
+def _exists(status):
+    """True for a hit, False for a definite miss, None for anything else."""
+    if status in (200, 206):
+        return True
+    if status in (404, 410):
         return False
+    return None
+
+async def head_ok(session, sem, url):
+    """Does url exist? HEAD first; a server or proxy that refuses HEAD
+    (405/501) is asked again with a one-byte ranged GET. None means the
+    probe failed (timeout, reset, 5xx...) and says nothing either way."""
+    async with sem:
+        try:
+            async with session.head(url, allow_redirects=True) as r:
+                if r.status not in (405, 501):
+                    return _exists(r.status)
+            async with session.get(url, headers={'Range': 'bytes=0-0'}) as r:
+                return _exists(r.status)
+        except Exception:
+            return None
+
+async def probe_all(session, sem, urls):
+    """HEAD every url concurrently on the shared session; {url: True/False/None}."""
+    async with asyncio.TaskGroup() as tg:
+        tasks = {u: tg.create_task(head_ok(session, sem, u)) for u in urls}
+    return {u: t.result() for u, t in tasks.items()}
+
+async def fetch_index(session):
+    """Book codes listed on the textbook index page, or None if it can't be read."""
+    try:
+        async with session.get(TEXTBOOK_PAGE, timeout=aiohttp.ClientTimeout(total=INDEX_TIMEOUT)) as r:
+            if r.status != 200:
+                return None
+            html = await r.text(errors='replace')
+    except Exception:
+        return None
+    return set(BOOK_CODE_RE.findall(html)) or None
 
-def check_book_exists(class_num, lang, subj_code, part):
-    """Check if a book exists (ZIP or chapter 01)."""
-    cc = CLASS_CODES[class_num]
-    code = f"{cc}{lang}{subj_code}{part}"
+async def scan_parts(session, sem, class_num, lang, subj_code, index=None):
+    """Find which parts (1-4) of a book exist: listed in the index if there
+    is one, else chapter 01 answers a probe. Returns ([(part, book_code, has_zip)],
+    settled), settled being False if a failed probe may have hidden a part."""
+    prefix = BOOKCODE_PREFIX[(class_num, lang)] + subj_code
+    codes = {part: prefix + str(part) for part in range(1, 5)}
+    base = BASE_URL + prefix
     
-    zip_url = f"{BASE_URL}{code}dd.zip"
-    ch1_url = f"{BASE_URL}{code}01.pdf"
+    if index is not None:
+        # The index settles existence for free on every scan, so a newly
+        # listed book shows up at once; only the ZIP probe is cached, per book
+        codes = {part: code for part, code in codes.items() if code in index}
+        has_zip = {part: cache_get(code + 'dd.zip') for part, code in codes.items()}
+        zips = {part: f"{base}{part}dd.zip" for part in codes if has_zip[part] is None}
+        found = await probe_all(session, sem, zips.values())
+        for part, url in zips.items():
+            if found[url] is not None:
+                cache_put(codes[part] + 'dd.zip', found[url])
+            has_zip[part] = found[url] is True
+        return [(part, code, has_zip[part]) for part, code in codes.items()], True
     
-    return url_exists(zip_url) or url_exists(ch1_url), code
+    hit = cache_get(prefix)
+    if hit is not None:
+        return [tuple(p) for p in hit], True
+    
+    # Every published book has a chapter 01, so that probe alone settles
+    # existence; the ZIP is only asked about for books that exist.
+    # A failed probe counts as a miss for this run only: the result isn't cached
+    ch1 = {part: f"{base}{part}01.pdf" for part in codes}
+    found = await probe_all(session, sem, ch1.values())
+    settled = None not in found.values()
+    codes = {part: code for part, code in codes.items() if found[ch1[part]]}
+    zips = {part: f"{base}{part}dd.zip" for part in codes}
+    found = await probe_all(session, sem, zips.values())
+    
+    parts = [(part, code, found[zips[part]] is True) for part, code in codes.items()]
+    if settled and None not in found.values():
+        cache_put(prefix, parts)
+    return parts, settled
 
-def scan_chapters(book_code):
-    """Scan available chapters for a book."""
-    chapters = []
-    misses = 0
+async def scan_chapters(session, sem, book_code):
+    """Scan available chapters for a book.
+    Marker chapters let the scan jump ahead, so a short book needs a handful
+    of probes instead of all 40; each round is one concurrent batch."""
+    hit = cache_get(book_code)
+    if hit is not None:
+        return hit
+    base = BASE_URL + book_code
+    url = {n: f"{base}{n}.pdf" for n in CHAPTER_NUMS + SPECIAL_SECTIONS}
+    # Chapters up to MAX_GAP past the first marker are always needed, so they
+    # ride along in the first batch with the markers and special sections;
+    # a book of up to four chapters is settled in this one round
+    first = CHAPTER_NUMS[:CHAPTER_MARKERS[0] + MAX_GAP]
+    found = await probe_all(session, sem, [url[n] for n in first] +
+                                          [url[CHAPTER_NUMS[m]] for m in CHAPTER_MARKERS[:-1] if m >= len(first)] +
+                                          [url[sp] for sp in SPECIAL_SECTIONS])
     
-    for ch in range(0, 40):
-        ch_str = f"{ch:02d}"
-        if url_exists(f"{BASE_URL}{book_code}{ch_str}.pdf"):
-            chapters.append(ch_str)
-            misses = 0
+    # Books can skip chapter numbers (keww1 has no 09-10), so the scan only
+    # ends after MAX_GAP misses past the highest chapter seen, marker or not.
+    # Everything below that chapter's next marker is probed too.
+    while True:
+        hits = [i for i, n in enumerate(CHAPTER_NUMS) if found.get(url[n])]
+        if hits:
+            top = hits[-1]
+            hi = min(CHAPTER_MARKERS[-1], max(top + MAX_GAP + 1, next(m for m in CHAPTER_MARKERS if m > top)))
         else:
-            misses += 1
-            if misses > 3 and chapters: 
-                break
-    
-    # Check special sections
-    for sp in ['ps','an','ap','gl','lp','dd']:
-        if url_exists(f"{BASE_URL}{book_code}{sp}.pdf"):
-            chapters.append(sp)
+            hi = CHAPTER_MARKERS[-1]
+        todo = [url[n] for n in CHAPTER_NUMS[:hi] if url[n] not in found]
+        if not todo:
+            break
+        found.update(await probe_all(session, sem, todo))
     
-    return chapters
+    chapters = [n for n in CHAPTER_NUMS if found.get(url[n])]
+    chapters += [sp for sp in SPECIAL_SECTIONS if found[url[sp]]]
+    # Only cache a list no failed probe contributed to; an empty one means
+    # the book isn't uploaded yet (the index can list it early), so ask again
+    return cache_put(book_code, chapters) if chapters and None not in found.values() else chapters
 
 def banner():
     w = tw()
@@ -107,63 +252,141 @@ def banner():
 # MAIN SCANNER
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def scan_all():
-    """Scan entire NCERT catalog."""
+def load_hints():
+    """{class_num: {subject_code: (name, languages)}} from the previous catalog.json."""
+    try:
+        classes = json.loads(CATALOG_FILE.read_text(encoding='utf-8'))["classes"]
+    except (OSError, ValueError, KeyError):
+        return {}
+    return {int(c): {subj["code"]: (name, subj["languages"]) for name, subj in class_data.items()}
+            for c, class_data in classes.items()}
+
+async def scan_class(session, sem, class_num, index=None, hint=None):
+    """Scan one class: every (subject, language) part check at once, then
+    the chapters of every book found. Returns (class_data, books_found)."""
+    if index is None and hint:
+        # No index to go by: only probe subjects the last catalog had for
+        # this class (--refresh drops the hints and probes them all)
+        subjects = {code: name for code, name in SUBJECT_CODES.items() if code in hint}
+        subjects.update((code, name) for code, (name, _) in hint.items() if code not in subjects)
+    else:
+        # Subject codes the index lists but SUBJECT_CODES doesn't know yet are
+        # scanned too, named by their code
+        subjects = dict(SUBJECT_CODES)
+        for code in sorted(index or ()):
+            if code[0] == CLASS_CODES[class_num]:
+                subjects.setdefault(code[2:4], code[2:4])
+    
+    async with asyncio.TaskGroup() as tg:
+        found = {(subj_code, lang_code): tg.create_task(scan_parts(session, sem, class_num, lang_code, subj_code, index))
+                 for subj_code in subjects for lang_code in LANG_CODES}
+    found = {key: t.result() for key, t in found.items()}
+    
+    # Where a failed probe left existence open, parts the last catalog had
+    # are kept, so one bad probe can't drop a book from the hints for good
+    kept = {}
+    for (subj_code, lang_code), (_, settled) in found.items():
+        if not settled and index is None and hint and subj_code in hint:
+            kept[(subj_code, lang_code)] = hint[subj_code][1].get(lang_code, {}).get("parts", {})
+    found = {key: parts for key, (parts, _) in found.items()}
+    
+    async with asyncio.TaskGroup() as tg:
+        chapters = {book_code: tg.create_task(scan_chapters(session, sem, book_code))
+                    for parts in found.values() for _, book_code, _ in parts}
+    
+    class_data = {}
+    books = 0
+    lines = []    # written in one go once the class is assembled
+    for subj_code, subj_name in subjects.items():
+        subj_data = {"code": subj_code, "languages": {}}
+        
+        for lang_code in LANG_CODES:
+            lang_data = {"parts": {}}
+            
+            entries = dict(kept.get((subj_code, lang_code), {}))
+            for part, book_code, has_zip in found[(subj_code, lang_code)]:
+                book_chapters = chapters[book_code].result()
+                # Listed in the index but no files on the server (yet)
+                if not book_chapters and not has_zip:
+                    continue
+                entries[str(part)] = {
+                    "code": book_code,
+                    "chapters": book_chapters,
+                    "has_zip": has_zip
+                }
+            
+            for part in sorted(entries, key=int):
+                if VERBOSE:
+                    lines.append(f"   {C.G}✓{C.E} {subj_name} ({LANG_CODES[lang_code]}) Part {part} [{len(entries[part]['chapters'])} ch]\n")
+                lang_data["parts"][part] = entries[part]
+                books += 1
+            
+            if lang_data["parts"]:
+                subj_data["languages"][lang_code] = lang_data
+        
+        if subj_data["languages"]:
+            class_data[subj_name] = subj_data
+    
+    if not VERBOSE:
+        lines.append(f"   {C.G}✓{C.E} {books} books\n")
+    sys.stdout.write(''.join(lines))
+    sys.stdout.flush()
+    return class_data, books
+
+async def scan_all_async(catalog, hints):
+    """Scan every class over one pooled session; returns total books found.
+    The semaphore caps probes in flight, the connector reuses connections."""
+    sem = asyncio.Semaphore(64)
+    connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=60)
+    # Probe timeouts; fetch_index passes its own, longer one for the big page
+    client_timeout = aiohttp.ClientTimeout(sock_connect=PROBE_TIMEOUT, sock_read=PROBE_TIMEOUT)
+    total_books = 0
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers={'User-Agent': USER_AGENT}) as session:
+        # One GET of the index page replaces the per-part existence probes;
+        # if it can't be read, parts are probed instead - only for subjects
+        # the last catalog had, unless there are no hints (--refresh)
+        index = await fetch_index(session)
+        if index is None and hints:
+            print(f" {C.D}Textbook index unavailable, probing subjects from the last catalog (use --refresh for all){C.E}")
+        elif index is None:
+            print(f" {C.D}Textbook index unavailable, probing every subject{C.E}")
+        
+        for class_num in range(1, 13):
+            print(f"\n{C.Y}{'─'*tw()}{C.E}")
+            print(f" {C.HDR}Class {class_num}{C.E}")
+            
+            class_data, books = await scan_class(session, sem, class_num, index, hints.get(class_num))
+            if class_data:
+                catalog["classes"][str(class_num)] = class_data
+            total_books += books
+            save_cache()
+    return total_books
+
+def scan_all(refresh=False):
+    """Scan entire NCERT catalog. Cached probe results younger than
+    DISCOVERY_TTL, and the subject list of the previous catalog, are reused
+    unless refresh is set."""
     banner()
+    hints = {}
+    if not refresh:
+        load_cache()
+        hints = load_hints()
     
     catalog = {
         "last_updated": datetime.now().isoformat(),
         "classes": {}
     }
     
-    total_books = 0
     start_time = time.time()
     
     print(f" {C.D}This will take several minutes. Please wait...{C.E}\n")
     
-    # Scan each class
-    for class_num in range(1, 13):
-        print(f"\n{C.Y}{'─'*tw()}{C.E}")
-        print(f" {C.BD}{C.G}Class {class_num}{C.E}")
-        
-        class_data = {}
-        
-        # Scan each subject
-        for subj_code, subj_name in SUBJECT_CODES.items():
-            subject_found = False
-            subj_data = {"code": subj_code, "languages": {}}
-            
-            # Check each language
-            for lang_code in ['e', 'h', 'u']:
-                lang_data = {"parts": {}}
-                
-                # Check each part (1-4)
-                for part in range(1, 5):
-                    exists, book_code = check_book_exists(class_num, lang_code, subj_code, part)
-                    
-                    if exists:
-                        subject_found = True
-                        print(f"   {C.G}✓{C.E} {subj_name} ({LANG_CODES[lang_code]}) Part {part}", end='', flush=True)
-                        
-                        # Scan chapters
-                        chapters = scan_chapters(book_code)
-                        lang_data["parts"][str(part)] = {
-                            "code": book_code,
-                            "chapters": chapters,
-                            "has_zip": url_exists(f"{BASE_URL}{book_code}dd.zip")
-                        }
-                        
-                        print(f" [{len(chapters)} ch]")
-                        total_books += 1
-                
-                if lang_data["parts"]:
-                    subj_data["languages"][lang_code] = lang_data
-            
-            if subject_found:
-                class_data[subj_name] = subj_data
-        
-        if class_data:
-            catalog["classes"][str(class_num)] = class_data
+    # Books finished before an interrupt are kept, so a rerun resumes there
+    try:
+        total_books = asyncio.run(scan_all_async(catalog, hints))
+    finally:
+        save_cache()
     
     # Save catalog
     elapsed = time.time() - start_time
@@ -174,8 +397,7 @@ def scan_all():
     print(f"    ⏱️  Time taken: {C.BD}{elapsed/60:.1f} minutes{C.E}")
     
     # Save to file
-    with open(CATALOG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(catalog, f, indent=2, ensure_ascii=False)
+    CATALOG_FILE.write_bytes(_dumps(catalog))
     
     print(f"    💾 Saved to: {C.C}{CATALOG_FILE.name}{C.E}")
     print(f"{C.Y}{'═'*tw()}{C.E}\n")
@@ -187,8 +409,15 @@ def scan_all():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="NCERT Catalog Scanner")
+    ap.add_argument('--refresh', action='store_true',
+                    help="ignore cached probe results and rescan everything")
+    ap.add_argument('-q', '--quiet', action='store_true',
+                    help="print a book count per class instead of every book")
+    args = ap.parse_args()
+    VERBOSE = not args.quiet
     try:
-        scan_all()
+        scan_all(refresh=args.refresh)
     except KeyboardInterrupt:
         print(f"\n {C.Y}⚡ Scan interrupted{C.E}\n")
         sys.exit(1)
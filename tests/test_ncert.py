@@ -0,0 +1,110 @@
+"""Download-side checks that need no network: resume decisions and ZIP extraction."""
+import io, sys, asyncio, zipfile, tempfile, unittest
+from unittest import mock
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ncert
+
+class FakeHTTPError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+class FakeResponse:
+    def __init__(self, status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise FakeHTTPError(self.status)
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeSession:
+    """Answers HEAD with the queued responses, in order."""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.heads = 0
+    def head(self, url, **kwargs):
+        self.heads += 1
+        return self.responses.pop(0)
+
+class NeedDownloadTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "lemh101.pdf"
+
+    def check(self, have, headers):
+        if have is not None:
+            self.path.write_bytes(b"x" * have)
+        session = FakeSession(FakeResponse(headers=headers))
+        return asyncio.run(ncert._need_download(session, "url", self.path))
+
+    def test_missing_file(self):
+        self.assertEqual(self.check(None, {}), (False, {}))
+
+    def test_complete_file_is_skipped(self):
+        self.assertEqual(self.check(100, {'Content-Length': '100'}), (True, {}))
+
+    def test_shorter_file_resumes_only_if_unchanged(self):
+        headers = {'Content-Length': '100', 'Accept-Ranges': 'bytes', 'ETag': '"v2"'}
+        self.assertEqual(self.check(60, headers), (False, {'Range': 'bytes=60-', 'If-Range': '"v2"'}))
+
+    def test_last_modified_when_etag_is_weak(self):
+        headers = {'Content-Length': '100', 'Accept-Ranges': 'bytes', 'ETag': 'W/"v2"',
+                   'Last-Modified': 'Tue, 01 Jul 2025 00:00:00 GMT'}
+        self.assertEqual(self.check(60, headers)[1]['If-Range'], 'Tue, 01 Jul 2025 00:00:00 GMT')
+
+    def test_no_validator_rewrites(self):
+        # Without an ETag/Last-Modified a shorter file may be an older edition
+        self.assertEqual(self.check(60, {'Content-Length': '100', 'Accept-Ranges': 'bytes'}), (False, {}))
+
+    def test_no_ranges_rewrites(self):
+        self.assertEqual(self.check(60, {'Content-Length': '100', 'ETag': '"v2"'}), (False, {}))
+
+    def test_longer_file_rewrites(self):
+        self.assertEqual(self.check(120, {'Content-Length': '100', 'Accept-Ranges': 'bytes', 'ETag': '"v2"'}), (False, {}))
+
+    def test_head_429_backs_off(self):
+        self.path.write_bytes(b"x" * 100)
+        session = FakeSession(FakeResponse(429), FakeResponse(headers={'Content-Length': '100'}))
+        aiohttp = SimpleNamespace(ClientResponseError=FakeHTTPError)
+        with mock.patch.object(ncert, '_require', return_value=aiohttp), \
+             mock.patch('asyncio.sleep', mock.AsyncMock()), \
+             mock.patch('sys.stdout', io.StringIO()):
+            ok = asyncio.run(ncert._fetch(session, asyncio.Semaphore(1), "url", self.path, True))
+        self.assertTrue(ok)
+        self.assertEqual(session.heads, 2)
+
+class ExtractZipTest(unittest.TestCase):
+    def test_entries_stay_inside_dest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            buf = io.BytesIO()
+            with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as z:
+                z.writestr("../evil.txt", b"evil")
+                z.writestr("/abs.txt", b"abs")
+                z.writestr("a/../ok.txt", b"ok")
+                z.writestr("b/c/nested.txt", b"nested")
+                z.writestr("empty/", b"")
+            (tmp / "book.zip").write_bytes(buf.getvalue())
+            dest = tmp / "out" / "book"
+
+            ncert.extract_zip(tmp / "book.zip", dest)
+
+            # Only the three safe entries land, all inside dest
+            self.assertEqual(sorted(p.relative_to(dest).as_posix() for p in dest.rglob("*")),
+                             ["b", "b/c", "b/c/nested.txt", "empty", "ok.txt"])
+            self.assertEqual((dest / "ok.txt").read_bytes(), b"ok")
+            self.assertEqual((dest / "b" / "c" / "nested.txt").read_bytes(), b"nested")
+            self.assertEqual(sorted(p.name for p in (tmp / "out").iterdir()), ["book"])
+            self.assertFalse(Path("/abs.txt").exists())
+
+if __name__ == "__main__":
+    unittest.main()
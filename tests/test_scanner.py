@@ -0,0 +1,126 @@
+"""Replay catalog.json through the scanner against a fake server."""
+import io, sys, json, asyncio, contextlib, importlib.util, unittest
+from unittest import mock
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+if importlib.util.find_spec("aiohttp") is None:
+    raise unittest.SkipTest("scanner.py needs aiohttp")
+
+import scanner
+
+CATALOG = json.loads((Path(__file__).resolve().parent.parent / "catalog.json").read_text(encoding='utf-8'))
+BOOKS = {part["code"]: part
+         for class_data in CATALOG["classes"].values()
+         for subj in class_data.values()
+         for lang in subj["languages"].values()
+         for part in lang["parts"].values()}
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeSession:
+    """Answers 200 for every chapter and ZIP the catalog lists, 404 otherwise."""
+    def __init__(self):
+        self.urls = set()
+        for code, part in BOOKS.items():
+            self.urls.update(f"{scanner.BASE_URL}{code}{ch}.pdf" for ch in part["chapters"])
+            if part["has_zip"]:
+                self.urls.add(f"{scanner.BASE_URL}{code}dd.zip")
+        self.requests = 0
+        self.failing = set()
+
+    def head(self, url, **kwargs):
+        self.requests += 1
+        if url in self.failing:
+            return FakeResponse(503)
+        return FakeResponse(200 if url in self.urls else 404)
+    get = head
+
+class ScanChaptersTest(unittest.TestCase):
+    def setUp(self):
+        scanner.CACHE.clear()
+
+    def scan(self, book_code, session=None):
+        async def run():
+            return await scanner.scan_chapters(session or FakeSession(), asyncio.Semaphore(64), book_code)
+        return asyncio.run(run())
+
+    def test_catalog_books(self):
+        for code, part in BOOKS.items():
+            with self.subTest(book=code):
+                self.assertEqual(self.scan(code), part["chapters"])
+
+    def test_gapped_books(self):
+        # Chapter numbering skips 06-08, 09-10 and 09-10 respectively
+        for code in ("khec1", "keww1", "lefl1"):
+            with self.subTest(book=code):
+                self.assertEqual(self.scan(code), BOOKS[code]["chapters"])
+
+    def test_short_books_take_one_round(self):
+        # Four-chapter books: 00-08, markers and specials go out in one batch
+        for code in ("iess2", "lehs1", "leac1"):
+            with self.subTest(book=code), mock.patch.object(scanner, 'probe_all', wraps=scanner.probe_all) as probe:
+                self.assertEqual(self.scan(code), BOOKS[code]["chapters"])
+                self.assertEqual(probe.call_count, 1)
+
+    def test_failed_probe_is_not_cached(self):
+        session = FakeSession()
+        session.failing.add(f"{scanner.BASE_URL}lemh103.pdf")
+        chapters = self.scan("lemh1", session)
+        self.assertNotIn("03", chapters)
+        self.assertIsNone(scanner.cache_get("lemh1"))
+        # The next run probes again and gets the full list
+        self.assertEqual(self.scan("lemh1"), BOOKS["lemh1"]["chapters"])
+        self.assertEqual(scanner.cache_get("lemh1"), BOOKS["lemh1"]["chapters"])
+
+class ScanPartsTest(unittest.TestCase):
+    def setUp(self):
+        scanner.CACHE.clear()
+
+    def scan(self, index=None):
+        async def run():
+            return await scanner.scan_parts(FakeSession(), asyncio.Semaphore(64), 12, 'e', 'mh', index)
+        return asyncio.run(run())
+
+    def test_probed_parts(self):
+        self.assertEqual(self.scan(), ([(1, "lemh1", True), (2, "lemh2", True)], True))
+
+    def test_index_overrides_cached_parts(self):
+        # A book the index lists is found even if an older scan cached none
+        scanner.cache_put("lemh", [])
+        self.assertEqual(self.scan(index={"lemh1", "lemh2"}), ([(1, "lemh1", True), (2, "lemh2", True)], True))
+
+class ScanClassTest(unittest.TestCase):
+    def setUp(self):
+        scanner.CACHE.clear()
+
+    def test_failed_probe_keeps_hinted_parts(self):
+        maths = CATALOG["classes"]["12"]["Mathematics"]
+        hint = {"mh": ("Mathematics", maths["languages"])}
+        session = FakeSession()
+        session.failing.add(f"{scanner.BASE_URL}lemh101.pdf")
+        async def run():
+            return await scanner.scan_class(session, asyncio.Semaphore(64), 12, hint=hint)
+        with contextlib.redirect_stdout(io.StringIO()):
+            class_data, books = asyncio.run(run())
+        self.assertEqual(class_data, {"Mathematics": maths})
+        self.assertIsNone(scanner.cache_get("lemh"))
+
+    def test_index_book_without_files_is_dropped(self):
+        index = set(BOOKS) | {"lemh3"}
+        async def run():
+            return await scanner.scan_class(FakeSession(), asyncio.Semaphore(64), 12, index=index)
+        with contextlib.redirect_stdout(io.StringIO()):
+            class_data, books = asyncio.run(run())
+        self.assertEqual(class_data["Mathematics"], CATALOG["classes"]["12"]["Mathematics"])
+        self.assertIsNone(scanner.cache_get("lemh3"))
+
+if __name__ == "__main__":
+    unittest.main()